@@ -132,6 +132,8 @@ async def get_chat(
         
     except HTTPException:
         raise
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Failed to get chat {chat_id} for user {current_user.id}: {e}")
         raise HTTPException(status_code=500, detail="Failed to retrieve chat session")
@@ -0,0 +1,8 @@
+"""Shared assertion helpers for backend tests"""
+
+
+def assert_awaited_with(mock, **expected):
+    """Assert an AsyncMock was awaited once with exactly the given keyword arguments"""
+    assert mock.await_count == 1, f"Expected one await, got {mock.await_count}"
+    actual = mock.await_args.kwargs
+    assert actual == expected, f"Awaited with {actual!r}, expected {expected!r}"
@@ -0,0 +1,105 @@
+"""Shared pytest fixtures for backend tests"""
+
+import pytest
+from functools import lru_cache
+from unittest.mock import AsyncMock, MagicMock, patch
+from fastapi.testclient import TestClient
+from bson import ObjectId
+from datetime import datetime
+
+from main import app
+from models.user import User, UserConfig
+from services.config_service import ConfigService
+from utils.encryption import encryption_service
+from utils.database_router import DatabaseRouter
+
+
+# Ciphertext for identical plaintext is interchangeable in tests, so each
+# distinct test vector is encrypted once per session.
+_encrypt_cached = lru_cache(maxsize=256)(encryption_service.encrypt)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _no_real_db_router():
+    """Hand any ChatService built during tests a mocked database router"""
+    with patch("services.chat_service.db_router", MagicMock(spec=DatabaseRouter)):
+        yield
+
+
+@pytest.fixture(scope="session")
+def client():
+    """Test client for the FastAPI application, shared across the session.
+
+    The application lifespan runs once per session with the MongoDB
+    connect/close hooks patched out, so startup never needs a real server.
+    """
+    with patch("main.connect_to_mongo", new_callable=AsyncMock), \
+         patch("main.close_mongo_connection", new_callable=AsyncMock):
+        with TestClient(app) as test_client:
+            yield test_client
+
+
+@pytest.fixture
+def mock_user():
+    """Authenticated user with a configured database connection"""
+    return User.model_construct(
+        id=ObjectId(),
+        email="test@example.com",
+        password_hash="hashed_password",
+        user_mongodb_connection="mongodb://localhost:27017/test_db",
+        preferred_llm_provider="openai"
+    )
+
+
+@pytest.fixture(scope="session")
+def config_service():
+    """Single ConfigService instance; tests only patch its attributes"""
+    return ConfigService()
+
+
+@pytest.fixture(scope="session")
+def encrypt_cached():
+    """Memoized encryption_service.encrypt for repeated test vectors"""
+    return _encrypt_cached
+
+
+@pytest.fixture(scope="session")
+def sample_user(encrypt_cached):
+    """User with encrypted API keys and MongoDB connection"""
+    return User(
+        id="507f1f77bcf86cd799439011",
+        email="test@example.com",
+        password_hash="hashed_password",
+        api_keys={
+            "openai": encrypt_cached("sk-test123456789012345678901234567890"),
+            "gemini": encrypt_cached("test-gemini-key-123456789")
+        },
+        user_mongodb_connection=encrypt_cached("mongodb://localhost:27017/test"),
+        preferred_llm_provider="openai",
+        created_at=datetime.utcnow(),
+        updated_at=datetime.utcnow()
+    )
+
+
+@pytest.fixture(scope="session")
+def sample_config():
+    """Configuration update touching keys, connection and provider"""
+    return UserConfig(
+        api_keys={
+            "openai": "sk-new123456789012345678901234567890",
+            "groq": "gsk_test123456789012345678901234567890"
+        },
+        user_mongodb_connection="mongodb://localhost:27017/newtest",
+        preferred_llm_provider="groq"
+    )
+
+
+@pytest.fixture
+def mock_platform_db(mocker):
+    """Patched platform database whose users.update_one reports one change"""
+    mock_db = MagicMock()
+    mock_collection = MagicMock()
+    mock_db.users = mock_collection
+    mock_collection.update_one = AsyncMock(return_value=MagicMock(modified_count=1))
+    mocker.patch('services.config_service.get_platform_database', return_value=mock_db)
+    return mock_db, mock_collection
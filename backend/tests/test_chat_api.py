@@ -1,54 +1,73 @@
 """Integration tests for chat API endpoints"""
 
 import pytest
-from fastapi.testclient import TestClient
+from fastapi import HTTPException
 from unittest.mock import AsyncMock, patch
 from datetime import datetime
 from bson import ObjectId
+from pydantic import ValidationError
 
 from main import app
-from models.chat import ChatSession, Message
+from models.chat import ChatSession, Message, ChatSessionCreate, MessageCreateValidated
 from models.user import User
 from services.chat_service import chat_service
 from utils.auth_middleware import get_current_user
 
 
+# Shared test data. These models are never mutated by the tests, so they are
+# built once at import time with model_construct() instead of being
+# re-validated in every setup_method.
+_CONN = "mongodb://localhost:27017/test_db"
+_EMAIL = "test@example.com"
+_PWHASH = "hashed_password"
+_LLM = "openai"
+_NOW = datetime.utcnow()
+
+USER_ID = str(ObjectId())
+CHAT_ID = str(ObjectId())
+
+MOCK_USER = User.model_construct(
+    id=ObjectId(USER_ID),
+    email=_EMAIL,
+    password_hash=_PWHASH,
+    user_mongodb_connection=_CONN,
+    preferred_llm_provider=_LLM
+)
+
+MOCK_CHAT = ChatSession.model_construct(
+    id=ObjectId(CHAT_ID),
+    user_id=USER_ID,
+    title="Test Chat",
+    created_at=_NOW,
+    updated_at=_NOW
+)
+
+MOCK_MESSAGE = Message.model_construct(
+    id=ObjectId(),
+    chat_id=CHAT_ID,
+    content="Test message",
+    role="user",
+    timestamp=_NOW
+)
+
+# Variants are copied from the base models rather than rebuilt
+USER_WITHOUT_DB = MOCK_USER.model_copy(update={"user_mongodb_connection": None})
+DIFFERENT_USER_CHAT = MOCK_CHAT.model_copy(update={"user_id": str(ObjectId())})
+
+
 class TestChatAPI:
     """Test cases for chat API endpoints"""
 
-    def setup_method(self):
+    @pytest.fixture(autouse=True)
+    def setup(self, client):
         """Set up test fixtures"""
-        self.client = TestClient(app)
-        self.user_id = str(ObjectId())
-        self.chat_id = str(ObjectId())
-        self.user_connection = "mongodb://localhost:27017/test_db"
-        
-        # Mock user
-        self.mock_user = User(
-            id=ObjectId(self.user_id),
-            email="test@example.com",
-            password_hash="hashed_password",
-            user_mongodb_connection=self.user_connection,
-            preferred_llm_provider="openai"
-        )
-        
-        # Mock chat session
-        self.mock_chat = ChatSession(
-            id=ObjectId(self.chat_id),
-            user_id=self.user_id,
-            title="Test Chat",
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow()
-        )
-        
-        # Mock message
-        self.mock_message = Message(
-            id=ObjectId(),
-            chat_id=self.chat_id,
-            content="Test message",
-            role="user",
-            timestamp=datetime.utcnow()
-        )
+        self.client = client
+        self.user_id = USER_ID
+        self.chat_id = CHAT_ID
+        self.user_connection = _CONN
+        self.mock_user = MOCK_USER
+        self.mock_chat = MOCK_CHAT
+        self.mock_message = MOCK_MESSAGE
 
     def teardown_method(self):
         """Clean up after tests"""
@@ -75,15 +94,7 @@ class TestChatAPI:
 
     def test_get_chats_no_database_connection(self):
         """Test get chats with no user database connection"""
-        user_without_db = User(
-            id=ObjectId(self.user_id),
-            email="test@example.com",
-            password_hash="hashed_password",
-            user_mongodb_connection=None,  # No database connection
-            preferred_llm_provider="openai"
-        )
-        
-        app.dependency_overrides[get_current_user] = lambda: user_without_db
+        app.dependency_overrides[get_current_user] = lambda: USER_WITHOUT_DB
         
         response = self.client.get("/api/chats/")
         
@@ -133,17 +144,10 @@ class TestChatAPI:
 
     def test_create_chat_no_database_connection(self):
         """Test chat creation with no user database connection"""
-        user_without_db = User(
-            id=ObjectId(self.user_id),
-            email="test@example.com",
-            password_hash="hashed_password",
-            user_mongodb_connection=None,
-            preferred_llm_provider="openai"
-        )
         chat_data = {"title": "New Test Chat"}
         
         with patch('routers.chat.get_current_user') as mock_get_user:
-            mock_get_user.return_value = user_without_db
+            mock_get_user.return_value = USER_WITHOUT_DB
             
             response = self.client.post("/api/chats/", json=chat_data)
             
@@ -178,18 +182,10 @@ class TestChatAPI:
 
     def test_get_chat_access_denied(self):
         """Test access denied to chat owned by different user"""
-        different_user_chat = ChatSession(
-            id=ObjectId(self.chat_id),
-            user_id=str(ObjectId()),  # Different user ID
-            title="Test Chat",
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow()
-        )
-        
         with patch('routers.chat.get_current_user') as mock_get_user:
             with patch.object(chat_service, 'get_chat_session', new_callable=AsyncMock) as mock_get_chat:
                 mock_get_user.return_value = self.mock_user
-                mock_get_chat.return_value = different_user_chat
+                mock_get_chat.return_value = DIFFERENT_USER_CHAT
                 
                 response = self.client.get(f"/api/chats/{self.chat_id}")
                 
@@ -341,13 +337,15 @@ class TestChatAPI:
 
     def test_unauthorized_access(self):
         """Test unauthorized access to chat endpoints"""
-        with patch('routers.chat.get_current_user') as mock_get_user:
-            mock_get_user.side_effect = Exception("Unauthorized")
-            
-            response = self.client.get("/api/chats/")
-            
-            # The exact status code depends on how the auth middleware handles exceptions
-            assert response.status_code in [401, 500]
+        def reject_credentials():
+            raise HTTPException(status_code=401, detail="Could not validate credentials")
+        
+        app.dependency_overrides[get_current_user] = reject_credentials
+        
+        response = self.client.get("/api/chats/")
+        
+        assert response.status_code == 401
+        assert response.json()["detail"] == "Could not validate credentials"
 
     def test_database_error_handling(self):
         """Test handling of database errors"""
@@ -364,15 +362,15 @@ class TestChatAPI:
     def test_invalid_chat_id_format(self):
         """Test handling of invalid chat ID format"""
         invalid_chat_id = "invalid-id"
+        app.dependency_overrides[get_current_user] = lambda: self.mock_user
         
-        with patch('routers.chat.get_current_user') as mock_get_user:
-            with patch.object(chat_service, 'get_chat_session', new_callable=AsyncMock) as mock_get_chat:
-                mock_get_user.return_value = self.mock_user
-                mock_get_chat.side_effect = Exception("Invalid ObjectId")
-                
-                response = self.client.get(f"/api/chats/{invalid_chat_id}")
-                
-                assert response.status_code == 500
+        with patch.object(chat_service, 'get_chat_session', new_callable=AsyncMock) as mock_get_chat:
+            mock_get_chat.side_effect = ValueError(f"Invalid ObjectId string: {invalid_chat_id}")
+            
+            response = self.client.get(f"/api/chats/{invalid_chat_id}")
+            
+            assert response.status_code == 400
+            assert "Invalid ObjectId" in response.json()["detail"]
 
     def test_concurrent_message_sending(self):
         """Test handling of concurrent message sending"""
@@ -400,79 +398,53 @@ class TestChatAPI:
 class TestChatAPIValidation:
     """Test cases for API input validation"""
 
-    def setup_method(self):
-        """Set up test fixtures"""
-        self.client = TestClient(app)
-        self.user_id = str(ObjectId())
-        self.mock_user = User(
-            id=ObjectId(self.user_id),
-            email="test@example.com",
-            password_hash="hashed_password",
-            user_mongodb_connection="mongodb://localhost:27017/test_db",
-            preferred_llm_provider="openai"
-        )
+    def teardown_method(self):
+        """Clean up after tests"""
+        app.dependency_overrides.clear()
+
+    # Request body validation is exercised on the models directly; the router
+    # wiring for body errors is covered by the invalid title/content tests above.
 
     def test_create_chat_title_too_long(self):
         """Test chat creation with title too long"""
         long_title = "x" * 201  # Exceeds 200 character limit
-        chat_data = {"title": long_title}
         
-        with patch('routers.chat.get_current_user') as mock_get_user:
-            mock_get_user.return_value = self.mock_user
-            
-            response = self.client.post("/api/chats/", json=chat_data)
-            
-            assert response.status_code == 422
+        with pytest.raises(ValidationError):
+            ChatSessionCreate(title=long_title)
 
     def test_send_message_content_too_long(self):
         """Test sending message with content too long"""
         long_content = "x" * 10001  # Exceeds 10000 character limit
-        message_data = {"content": long_content, "role": "user"}
-        chat_id = str(ObjectId())
         
-        with patch('routers.chat.get_current_user') as mock_get_user:
-            mock_get_user.return_value = self.mock_user
-            
-            response = self.client.post(f"/api/chats/{chat_id}/messages", json=message_data)
-            
-            assert response.status_code == 422
+        with pytest.raises(ValidationError):
+            MessageCreateValidated(content=long_content, role="user")
 
     def test_send_message_invalid_role(self):
         """Test sending message with invalid role"""
-        message_data = {"content": "Test message", "role": "invalid_role"}
-        chat_id = str(ObjectId())
-        
-        with patch('routers.chat.get_current_user') as mock_get_user:
-            mock_get_user.return_value = self.mock_user
-            
-            response = self.client.post(f"/api/chats/{chat_id}/messages", json=message_data)
-            
-            assert response.status_code == 422
+        with pytest.raises(ValidationError):
+            MessageCreateValidated(content="Test message", role="invalid_role")
 
-    def test_get_chats_invalid_limit(self):
+    def test_get_chats_invalid_limit(self, client, mock_user):
         """Test get chats with invalid limit parameter"""
-        with patch('routers.chat.get_current_user') as mock_get_user:
-            mock_get_user.return_value = self.mock_user
-            
-            # Test negative limit
-            response = self.client.get("/api/chats/?limit=-1")
-            assert response.status_code == 422
-            
-            # Test limit too high
-            response = self.client.get("/api/chats/?limit=101")
-            assert response.status_code == 422
+        app.dependency_overrides[get_current_user] = lambda: mock_user
+        
+        # Test negative limit
+        response = client.get("/api/chats/?limit=-1")
+        assert response.status_code == 422
+        
+        # Test limit too high
+        response = client.get("/api/chats/?limit=101")
+        assert response.status_code == 422
 
-    def test_get_messages_invalid_pagination(self):
+    def test_get_messages_invalid_pagination(self, client, mock_user):
         """Test get messages with invalid pagination parameters"""
         chat_id = str(ObjectId())
+        app.dependency_overrides[get_current_user] = lambda: mock_user
         
-        with patch('routers.chat.get_current_user') as mock_get_user:
-            mock_get_user.return_value = self.mock_user
-            
-            # Test negative skip
-            response = self.client.get(f"/api/chats/{chat_id}/messages?skip=-1")
-            assert response.status_code == 422
-            
-            # Test invalid limit
-            response = self.client.get(f"/api/chats/{chat_id}/messages?limit=1001")
-            assert response.status_code == 422
\ No newline at end of file
+        # Test negative skip
+        response = client.get(f"/api/chats/{chat_id}/messages?skip=-1")
+        assert response.status_code == 422
+        
+        # Test invalid limit
+        response = client.get(f"/api/chats/{chat_id}/messages?limit=1001")
+        assert response.status_code == 422
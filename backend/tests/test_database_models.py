@@ -283,14 +283,12 @@ class TestDatabaseManager:
 class TestDatabaseIntegration:
     """Integration tests for database operations"""
     
-    @pytest.mark.asyncio
     async def test_connection_validation(self):
         """Test connection validation (requires MongoDB)"""
         # This would test actual MongoDB connections
         # Skipped in unit tests
         pass
     
-    @pytest.mark.asyncio
     async def test_database_operations(self):
         """Test database CRUD operations (requires MongoDB)"""
         # This would test actual database operations
@@ -203,7 +203,6 @@ class TestValidationService:
         assert is_valid is False
         assert "Unsupported provider" in error
     
-    @pytest.mark.asyncio
     async def test_validate_mongodb_connection_valid(self):
         """Test valid MongoDB connection validation"""
         connection_string = "mongodb://localhost:27017/test"
@@ -221,7 +220,6 @@ class TestValidationService:
             mock_client.assert_called_once_with(connection_string, serverSelectionTimeoutMS=5000)
             mock_instance.admin.command.assert_called_once_with('ping')
     
-    @pytest.mark.asyncio
     async def test_validate_mongodb_connection_invalid_format(self):
         """Test invalid MongoDB connection format"""
         invalid_connections = [
@@ -235,7 +233,6 @@ class TestValidationService:
             assert is_valid is False
             assert "Invalid MongoDB connection string format" in error
     
-    @pytest.mark.asyncio
     async def test_validate_mongodb_connection_failure(self):
         """Test MongoDB connection failure"""
         connection_string = "mongodb://invalid:27017/test"
@@ -251,7 +248,6 @@ class TestValidationService:
             assert is_valid is False
             assert "Connection failed" in error
     
-    @pytest.mark.asyncio
     async def test_test_api_key_connection_openai_success(self):
         """Test OpenAI API key connection testing"""
         provider = "openai"
@@ -274,7 +270,6 @@ class TestValidationService:
             assert result["model_count"] == 2
             assert result["response_time"] is not None
     
-    @pytest.mark.asyncio
     async def test_test_api_key_connection_openai_failure(self):
         """Test OpenAI API key connection testing failure"""
         provider = "openai"
@@ -294,7 +289,6 @@ class TestValidationService:
             assert result["tested"] is True
             assert "Invalid API key" in result["error"]
     
-    @pytest.mark.asyncio
     async def test_test_api_key_connection_ollama_success(self):
         """Test Ollama API key connection testing"""
         provider = "ollama"
@@ -312,7 +306,6 @@ class TestValidationService:
             assert result["tested"] is True
             assert "Ollama local server is accessible" in result["note"]
     
-    @pytest.mark.asyncio
     async def test_test_api_key_connection_ollama_failure(self):
         """Test Ollama API key connection testing failure"""
         provider = "ollama"
@@ -330,7 +323,6 @@ class TestValidationService:
             assert result["tested"] is True
             assert "Ollama server returned status 404" in result["error"]
     
-    @pytest.mark.asyncio
     async def test_test_api_key_connection_unsupported_provider(self):
         """Test API key connection testing for unsupported provider"""
         provider = "unsupported"
@@ -9,13 +9,33 @@ from motor.motor_asyncio import AsyncIOMotorClient
 from utils.config import settings
 
 
+# Patterns are compiled once at import time rather than on every call
+EMAIL_PATTERN = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+UPPERCASE_PATTERN = re.compile(r'[A-Z]')
+LOWERCASE_PATTERN = re.compile(r'[a-z]')
+DIGIT_PATTERN = re.compile(r'\d')
+API_KEY_CHARSET_PATTERN = re.compile(r'^[A-Za-z0-9_-]+$')
+
+# API key format rules per provider, checked cheapest first:
+# prefix, then length bounds, then the character set regex
+API_KEY_PROVIDER_NAMES = {
+    'openai': 'OpenAI',
+    'gemini': 'Gemini',
+    'groq': 'Groq',
+    'mistral': 'Mistral',
+}
+API_KEY_PREFIX = {'openai': 'sk-', 'groq': 'gsk_'}
+API_KEY_MIN_LEN = {'openai': 20, 'gemini': 20, 'groq': 20, 'mistral': 20}
+API_KEY_MAX_LEN = {'openai': 100, 'gemini': 100, 'groq': 100, 'mistral': 100}
+API_KEY_CHARSET_CHECKED = frozenset({'gemini', 'mistral'})
+
+
 class ValidationService:
     
     @staticmethod
     def validate_email(email: str) -> bool:
         """Validate email format"""
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return bool(re.match(pattern, email))
+        return bool(EMAIL_PATTERN.match(email))
     
     @staticmethod
     def validate_password(password: str) -> tuple[bool, List[str]]:
@@ -25,13 +45,13 @@ class ValidationService:
         if len(password) < 8:
             errors.append("Password must be at least 8 characters long")
         
-        if not re.search(r'[A-Z]', password):
+        if not UPPERCASE_PATTERN.search(password):
             errors.append("Password must contain at least one uppercase letter")
         
-        if not re.search(r'[a-z]', password):
+        if not LOWERCASE_PATTERN.search(password):
             errors.append("Password must contain at least one lowercase letter")
         
-        if not re.search(r'\d', password):
+        if not DIGIT_PATTERN.search(password):
             errors.append("Password must contain at least one digit")
         
         return len(errors) == 0, errors
@@ -85,43 +105,22 @@ class ValidationService:
         if not api_key:
             return False, "API key cannot be empty"
         
-        if provider == 'openai':
-            if not api_key.startswith('sk-'):
-                return False, "OpenAI API key must start with 'sk-'"
-            if len(api_key) < 20:
-                return False, "OpenAI API key is too short"
-            # OpenAI keys are typically 51 characters long
-            if len(api_key) > 100:
-                return False, "OpenAI API key is too long"
-        
-        elif provider == 'gemini':
-            if len(api_key) < 20:
-                return False, "Gemini API key is too short"
-            if len(api_key) > 100:
-                return False, "Gemini API key is too long"
-            # Gemini keys typically contain alphanumeric characters and hyphens
-            if not re.match(r'^[A-Za-z0-9_-]+$', api_key):
-                return False, "Gemini API key contains invalid characters"
+        name = API_KEY_PROVIDER_NAMES.get(provider)
+        if name is None:
+            return False, f"Unsupported provider: {provider}"
         
-        elif provider == 'groq':
-            if not api_key.startswith('gsk_'):
-                return False, "Groq API key must start with 'gsk_'"
-            if len(api_key) < 20:
-                return False, "Groq API key is too short"
-            if len(api_key) > 100:
-                return False, "Groq API key is too long"
+        prefix = API_KEY_PREFIX.get(provider)
+        if prefix and not api_key.startswith(prefix):
+            return False, f"{name} API key must start with '{prefix}'"
         
-        elif provider == 'mistral':
-            if len(api_key) < 20:
-                return False, "Mistral API key is too short"
-            if len(api_key) > 100:
-                return False, "Mistral API key is too long"
-            # Mistral keys typically contain alphanumeric characters
-            if not re.match(r'^[A-Za-z0-9_-]+$', api_key):
-                return False, "Mistral API key contains invalid characters"
+        if len(api_key) < API_KEY_MIN_LEN[provider]:
+            return False, f"{name} API key is too short"
+        if len(api_key) > API_KEY_MAX_LEN[provider]:
+            return False, f"{name} API key is too long"
         
-        else:
-            return False, f"Unsupported provider: {provider}"
+        # Gemini and Mistral keys contain alphanumeric characters and hyphens
+        if provider in API_KEY_CHARSET_CHECKED and not API_KEY_CHARSET_PATTERN.match(api_key):
+            return False, f"{name} API key contains invalid characters"
         
         return True, None
     